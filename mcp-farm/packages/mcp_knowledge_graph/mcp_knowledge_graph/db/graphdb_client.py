@@ -36,10 +36,13 @@ def _gql_legacy_named(schema_id: str) -> str:
     return f"{GRAPHDB_BASE}/graphql/{schema_id}"
 
 
-def sparql_update(update: str) -> None:
+def sparql_update(update: str | bytes) -> None:
+    # Accept pre-encoded payloads so callers can hand bytes straight through
+    # without a decode/re-encode round-trip on large updates.
+    body = update if isinstance(update, bytes) else update.encode("utf-8")
     r = requests.post(
         SPARQL_UPDATE_URL,
-        data=update.encode("utf-8"),
+        data=body,
         headers={
             "Content-Type": "application/sparql-update",
             "Accept": "application/sparql-results+json,application/json,text/plain,*/*"
@@ -2,6 +2,8 @@ from ..db.graphdb_client import sparql_update
 from ..utils.ids import sha1
 
 def upsert_indicator(canonical_name: str) -> None:
+    if not canonical_name:
+        raise ValueError("canonical_name is required (explicit IRI required)")
     iri = f"<http://example.org/indicator#{canonical_name}>"
     update = f"""
 PREFIX kg:   <http://example.org/kg#>
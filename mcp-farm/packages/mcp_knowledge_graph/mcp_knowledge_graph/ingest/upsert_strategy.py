@@ -3,6 +3,7 @@ from typing import Dict, Any, List
 from ..db.graphdb_client import sparql_update
 from ..utils.ids import strategy_iri, rule_iri, indicator_usage_iri, sha1
 from ..utils.dsl import normalize_dsl
+from ..utils.index import index_strategy
 
 def _triple(s: str, p: str, o: str) -> str:
     return f"{s} {p} {o} .\n"
@@ -16,7 +17,8 @@ def upsert_strategy(doc: Dict[str, Any]) -> None:
 
     # Build a canonical signals string then hash it for a safe IRI token
     sig_canon_list = [normalize_dsl(r) for r in entry_rules + exit_rules]
-    sig_canon = "__".join(sorted(sig_canon_list))
+    # Dedup equivalent rules so duplicated input still hashes to a stable IRI.
+    sig_canon = "__".join(sorted(set(sig_canon_list)))
     s_iri = f"<{strategy_iri(name, family, sig_canon)}>"
 
     triples = []
@@ -40,6 +42,10 @@ def upsert_strategy(doc: Dict[str, Any]) -> None:
     # IndicatorUsage
     for iu in indicators:
         canonical = iu.get("canonical_name")
+        if not canonical:
+            # Every emitted node must carry an explicit IRI; a missing name would
+            # otherwise produce a bogus <...indicator#None> node.
+            raise ValueError("indicator entry missing canonical_name (explicit IRI required)")
         role = iu.get("role", "filter")
         params = json.dumps(iu.get("params", {})).replace('"', '\\"')
         iu_iri = f"<{indicator_usage_iri(s_iri, canonical, role)}>"
@@ -52,3 +58,11 @@ def upsert_strategy(doc: Dict[str, Any]) -> None:
 
     insert = "PREFIX kg: <http://example.org/kg#>\nINSERT DATA {\n" + "".join(triples) + "}"
     sparql_update(insert)
+
+    # Keep the session-local indexes in sync so repeat lookups skip GraphDB.
+    index_strategy(
+        signature=sha1(sig_canon),
+        strategy_iri=s_iri.strip("<>"),
+        indicator_names=[iu["canonical_name"] for iu in indicators],
+        doc=doc,
+    )
@@ -2,10 +2,13 @@
 MCP-KG tool surface (skeleton). Wire these functions to your FastMCP server.
 """
 
+import orjson
+
 from .db.graphdb_client import graphql, sparql_update
 from .ingest.upsert_indicator import upsert_indicator
 from .ingest.upsert_strategy import upsert_strategy
 from .ingest.validators import validate_normalized_strategy
+from .utils.index import strategies_for_indicators, strategy_by_signature
 
 def tool_query_graphql(query: str, variables: dict | None = None, endpoint: str | None = None):
     return graphql(query, variables, endpoint)
@@ -26,6 +29,15 @@ def tool_validate_shapes(entity_type: str, payload: dict):
     validate_normalized_strategy(payload) if entity_type == "Strategy" else None
     return {"ok": True, "violations": []}
 
+def tool_search_strategies(indicators: list[str], timeframe: str | None = None, universe: str | None = None):
+    # Session-local inverted-index lookup: O(k) set intersection plus an
+    # optional timeframe/universe filter, no GraphDB hit.
+    return {"strategies": sorted(strategies_for_indicators(indicators, timeframe=timeframe, universe=universe))}
+
+def tool_get_strategy_by_signature(signature: str):
+    blob = strategy_by_signature(signature)
+    return None if blob is None else orjson.loads(blob)
+
 def tool_get_strategy_by_intent(intent: dict):
     # Simple mapper: build vars for the GraphQL query file
     indicators = intent.get("indicators", [])
@@ -0,0 +1,59 @@
+import orjson
+import pytest
+
+from mcp_knowledge_graph.utils.index import (
+    clear_indexes,
+    index_strategy,
+    strategies_for_indicators,
+    strategy_by_signature,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    """The indexes are module-level; keep tests isolated."""
+    clear_indexes()
+    yield
+    clear_indexes()
+
+
+def _doc(name: str, timeframe: str = "1h", universe=("BTCUSDT",)) -> dict:
+    return {
+        "name": name,
+        "family": "trend",
+        "timeframe": timeframe,
+        "universe": list(universe),
+        "signals": {"entry": ["rsi < 30"], "exit": ["rsi > 70"]},
+    }
+
+
+def test_indicator_intersection():
+    index_strategy("sig-a", "iri:a", ["RSI", "EMA"], _doc("a"))
+    index_strategy("sig-b", "iri:b", ["RSI"], _doc("b"))
+
+    assert strategies_for_indicators(["RSI"]) == {"iri:a", "iri:b"}
+    assert strategies_for_indicators(["RSI", "EMA"]) == {"iri:a"}
+    # Any unseen indicator empties the intersection.
+    assert strategies_for_indicators(["RSI", "MACD"]) == set()
+    assert strategies_for_indicators([]) == set()
+
+
+def test_timeframe_and_universe_filter():
+    index_strategy("sig-a", "iri:a", ["RSI"], _doc("a", timeframe="1h", universe=("BTCUSDT",)))
+    index_strategy("sig-b", "iri:b", ["RSI"], _doc("b", timeframe="4h", universe=("ETHUSDT", "BTCUSDT")))
+
+    assert strategies_for_indicators(["RSI"], timeframe="1h") == {"iri:a"}
+    assert strategies_for_indicators(["RSI"], universe="BTCUSDT") == {"iri:a", "iri:b"}
+    assert strategies_for_indicators(["RSI"], universe="ETHUSDT") == {"iri:b"}
+    assert strategies_for_indicators(["RSI"], timeframe="4h", universe="ETHUSDT") == {"iri:b"}
+    assert strategies_for_indicators(["RSI"], timeframe="1d") == set()
+
+
+def test_signature_lookup_roundtrip():
+    doc = _doc("a")
+    index_strategy("sig-a", "iri:a", ["RSI"], doc)
+
+    blob = strategy_by_signature("sig-a")
+    assert blob is not None
+    assert orjson.loads(blob) == doc
+    assert strategy_by_signature("sig-unknown") is None
@@ -1,2 +1,8 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
 def normalize_dsl(dsl: str) -> str:
+    # Pure string-in/string-out; the same rules recur across strategies, so
+    # memoizing skips the repeated split/replace work over a session.
     return " ".join(dsl.strip().lower().replace("crosses above","crosses_above").replace("crosses below","crosses_below").split())
@@ -0,0 +1,68 @@
+"""
+Session-local lookup indexes for ingested strategies.
+
+GraphDB stays the source of truth; these module-level dicts only short-circuit
+repeat lookups (search by indicator, fetch by signature) inside a long-lived
+MCP process so the common calls skip a SPARQL/GraphQL round-trip.
+"""
+from typing import Dict, Iterable, Optional, Set
+
+import orjson
+import zstandard as zstd
+
+# {indicator canonical_name: {strategy IRIs using it}}
+_ind_index: Dict[str, Set[str]] = {}
+# {strategy IRI: (timeframe, frozenset of universe symbols)} for cheap
+# post-intersection filtering without touching the compressed docs
+_meta_index: Dict[str, tuple] = {}
+# {signals signature: zstd-compressed serialized doc}
+_sig_index: Dict[str, bytes] = {}
+
+# Level 3 keeps compression cheap relative to ingest; JSON docs with repeated
+# keys/IRIs compress 5-10x, so the cache stays small over long sessions.
+_cctx = zstd.ZstdCompressor(level=3)
+_dctx = zstd.ZstdDecompressor()
+
+
+def index_strategy(signature: str, strategy_iri: str,
+                   indicator_names: Iterable[str], doc: dict) -> None:
+    for name in indicator_names:
+        _ind_index.setdefault(name, set()).add(strategy_iri)
+    _meta_index[strategy_iri] = (doc.get("timeframe"), frozenset(doc.get("universe") or ()))
+    _sig_index[signature] = _cctx.compress(orjson.dumps(doc))
+
+
+def strategies_for_indicators(indicators: Iterable[str],
+                              timeframe: Optional[str] = None,
+                              universe: Optional[str] = None) -> Set[str]:
+    """
+    O(k) set intersection over the inverted index (empty set on any miss),
+    optionally narrowed by exact timeframe and/or universe membership.
+    """
+    sets = [_ind_index.get(name) for name in indicators]
+    if not sets or any(s is None for s in sets):
+        return set()
+    hits = set.intersection(*map(set, sets[:1]), *sets[1:])
+    if timeframe is None and universe is None:
+        return hits
+    out: Set[str] = set()
+    for iri in hits:
+        tf, uni = _meta_index.get(iri, (None, frozenset()))
+        if timeframe is not None and tf != timeframe:
+            continue
+        if universe is not None and universe not in uni:
+            continue
+        out.add(iri)
+    return out
+
+
+def strategy_by_signature(signature: str) -> Optional[bytes]:
+    """Return the cached serialized doc (caller parses), or None if unseen."""
+    blob = _sig_index.get(signature)
+    return None if blob is None else _dctx.decompress(blob)
+
+
+def clear_indexes() -> None:
+    _ind_index.clear()
+    _meta_index.clear()
+    _sig_index.clear()
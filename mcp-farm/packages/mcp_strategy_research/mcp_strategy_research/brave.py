@@ -1,45 +1,161 @@
 # packages/mcp_strategy_research/mcp_strategy_research/brave.py
-from typing import Dict, List
-import os, requests, xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple
+import asyncio, contextvars, os, threading, time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+import aiohttp
+import orjson
+from lxml import etree
 
 BRAVE_API = "https://api.search.brave.com/res/v1/web/search"
 ARXIV_API = "http://export.arxiv.org/api/query"
 
+# Atom tags in Clark notation: skips the per-call namespace-map resolution
+# lxml does when find/findtext get an `namespaces=` argument.
+ATOM = "http://www.w3.org/2005/Atom"
+# One hardened parser instance reused across calls: entity expansion and
+# network access are off, huge-tree allocations are capped, and we skip
+# libxml2 parser re-init per response.
+_XML_PARSER = etree.XMLParser(
+    huge_tree=False, resolve_entities=False, no_network=True, recover=True
+)
+TAG_ENTRY = f"{{{ATOM}}}entry"
+TAG_TITLE = f"{{{ATOM}}}title"
+TAG_SUMMARY = f"{{{ATOM}}}summary"
+TAG_LINK = f"{{{ATOM}}}link"
+TAG_ID = f"{{{ATOM}}}id"
+
+_TIMEOUT = aiohttp.ClientTimeout(total=20)
+
+# One pooled session for the long-lived FastMCP loop, so the async tools
+# reuse connections across calls. The sync shims run on short-lived
+# asyncio.run() loops (possibly several at once on worker threads), so each
+# _run() owns a private session published via a ContextVar instead of the
+# global; otherwise a shim would orphan the long-lived loop's pool.
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+_session_lock = threading.Lock()
+_local_session: contextvars.ContextVar[Optional[aiohttp.ClientSession]] = \
+    contextvars.ContextVar("_local_session", default=None)
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    global _session, _session_loop
+    local = _local_session.get()
+    if local is not None:
+        return local
+    loop = asyncio.get_running_loop()
+    stale = None
+    with _session_lock:
+        if _session is None or _session.closed or _session_loop is not loop:
+            stale = _session
+            _session = aiohttp.ClientSession(timeout=_TIMEOUT)
+            _session_loop = loop
+        session = _session
+    if stale is not None and not stale.closed:
+        # The stale session belongs to another (possibly gone) loop; closing
+        # may fail there, but better a best-effort close than a leaked pool.
+        try:
+            await stale.close()
+        except Exception:
+            pass
+    return session
+
 
-def _arxiv_api_search(q: str, max_results: int = 10) -> List[Dict[str, str]]:
+def _run(coro):
+    """
+    Sync shim for legacy callers without a running loop. Each call owns its
+    session for the lifetime of its ephemeral loop and closes it before the
+    loop goes away; the module-global session is never touched.
+    """
+    async def _wrapped():
+        session = aiohttp.ClientSession(timeout=_TIMEOUT)
+        token = _local_session.set(session)
+        try:
+            return await coro
+        finally:
+            _local_session.reset(token)
+            await session.close()
+    return asyncio.run(_wrapped())
+
+
+# ---- In-process TTL cache for idempotent search GETs ----
+# Research sessions re-issue the same query across retries and orchestrator
+# re-runs; a hit skips the network round-trip and the JSON/XML parse.
+_CACHE_TTL = float(os.getenv("RESEARCH_SEARCH_CACHE_TTL", "600"))
+_CACHE_MAX = 256
+_CACHE: "OrderedDict[Tuple, Tuple[float, List[Dict[str, str]]]]" = OrderedDict()
+
+
+def _cache_get(key: Tuple) -> Optional[List[Dict[str, str]]]:
+    hit = _CACHE.get(key)
+    if hit is None:
+        return None
+    ts, value = hit
+    if time.monotonic() - ts >= _CACHE_TTL:
+        del _CACHE[key]
+        return None
+    _CACHE.move_to_end(key)
+    return list(value)
+
+
+def _cache_put(key: Tuple, value: List[Dict[str, str]]) -> None:
+    _CACHE[key] = (time.monotonic(), list(value))
+    _CACHE.move_to_end(key)
+    while len(_CACHE) > _CACHE_MAX:
+        _CACHE.popitem(last=False)
+
+
+def clear_search_cache() -> None:
+    _CACHE.clear()
+
+
+async def _arxiv_api_search_async(q: str, max_results: int = 10) -> List[Dict[str, str]]:
     """
     Direct arXiv Atom API search. Returns [{title, url, snippet}]
     """
-    params = {
-        "search_query": f"all:{q}",
-        "start": "0",
-        "max_results": str(max_results),
-        "sortBy": "relevance",
-        "sortOrder": "descending",
-    }
-    resp = requests.get(ARXIV_API, params=params, timeout=20)
-    resp.raise_for_status()
+    key = ("arxiv", q.strip().lower(), max_results)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    # Encode the query string once ourselves instead of handing a params
+    # dict to the client to rebuild.
+    url = ARXIV_API + "?" + urlencode(
+        {
+            "search_query": f"all:{q}",
+            "start": "0",
+            "max_results": str(max_results),
+            "sortBy": "relevance",
+            "sortOrder": "descending",
+        }
+    )
+    session = await _get_session()
+    async with session.get(url) as resp:
+        resp.raise_for_status()
+        body = await resp.read()
     out: List[Dict[str, str]] = []
-    root = ET.fromstring(resp.text)
-    ns = {"a": "http://www.w3.org/2005/Atom"}
-    for entry in root.findall("a:entry", ns):
-        title = (entry.findtext("a:title", default="", namespaces=ns) or "").strip()
-        summary = (entry.findtext("a:summary", default="", namespaces=ns) or "").strip().replace("\n", " ")
+    # lxml's C parser over raw bytes: no str decode pass, no pure-Python DOM.
+    root = etree.fromstring(body, _XML_PARSER)
+    for entry in root.iterfind(TAG_ENTRY):
+        title = (entry.findtext(TAG_TITLE) or "").strip()
+        summary = (entry.findtext(TAG_SUMMARY) or "").strip().replace("\n", " ")
         url = ""
-        for link in entry.findall("a:link", ns):
+        for link in entry.findall(TAG_LINK):
             href = link.attrib.get("href", "")
             if href and "arxiv.org/abs/" in href:
                 url = href
                 break
         if not url:
             # fallback to <id>
-            url = entry.findtext("a:id", default="", namespaces=ns) or ""
+            url = entry.findtext(TAG_ID) or ""
         if title and url:
             out.append({"title": title, "url": url, "snippet": summary})
+    _cache_put(key, out)
     return out
 
 
-def _brave_search(q: str, max_results: int = 10) -> List[Dict[str, str]]:
+async def _brave_search_async(q: str, max_results: int = 10) -> List[Dict[str, str]]:
     """
     Brave Web Search (JSON). Returns [{title, url, snippet}]
     """
@@ -47,11 +163,19 @@ def _brave_search(q: str, max_results: int = 10) -> List[Dict[str, str]]:
     if not key:
         # graceful no-key fallback
         return []
+    cache_key = ("brave", q.strip().lower(), max_results)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
     headers = {"X-Subscription-Token": key, "Accept": "application/json"}
     params = {"q": q, "count": max_results}
-    r = requests.get(BRAVE_API, headers=headers, params=params, timeout=20)
-    r.raise_for_status()
-    js = r.json()
+    session = await _get_session()
+    async with session.get(BRAVE_API, headers=headers, params=params) as r:
+        r.raise_for_status()
+        body = await r.read()
+    # orjson over raw bytes: no UTF-8 decode pass and a faster parse than
+    # stdlib json for the nested Brave payload.
+    js = orjson.loads(body)
     out: List[Dict[str, str]] = []
     for it in js.get("web", {}).get("results", []):
         out.append(
@@ -61,45 +185,105 @@ def _brave_search(q: str, max_results: int = 10) -> List[Dict[str, str]]:
                 "snippet": it.get("description", ""),
             }
         )
+    _cache_put(cache_key, out)
     return out
 
 
-def search(query: str, max_results: int = 10, site: str = "arxiv.org") -> List[Dict[str, str]]:
+async def search_async(query: str, max_results: int = 10, site: str = "arxiv.org") -> List[Dict[str, str]]:
     """
-    Existing tool impl: keeps arXiv fast-path, otherwise uses Brave.
+    Async core of search(): keeps arXiv fast-path, otherwise uses Brave.
     """
     q = query
     if site:
         q = f"{query} site:{site}"
     if site and "arxiv" in site.lower():
-        res = _arxiv_api_search(query, max_results=max_results)
+        res = await _arxiv_api_search_async(query, max_results=max_results)
         if res:
             return res
-        return _brave_search(q, max_results=max_results)
-    return _brave_search(q, max_results=max_results)
+        return await _brave_search_async(q, max_results=max_results)
+    return await _brave_search_async(q, max_results=max_results)
+
+
+async def multi_source_search_async(query: str, max_results: int = 10) -> List[Dict[str, str]]:
+    """
+    Fire arXiv + SSRN + IDEAS legs concurrently and merge, deduping by URL.
+    Wall time becomes the slowest leg instead of the sum of three
+    round-trips; a failed leg is skipped rather than failing the batch.
+    """
+    legs = await asyncio.gather(
+        arxiv_search_async(query, max_results=max_results),
+        ssrn_search_async(query, max_results=max_results),
+        ideas_search_async(query, max_results=max_results),
+        return_exceptions=True,
+    )
+    seen: set = set()
+    out: List[Dict[str, str]] = []
+    for leg in legs:
+        if isinstance(leg, BaseException):
+            continue
+        for r in leg:
+            if r["url"] not in seen:
+                seen.add(r["url"])
+                out.append(r)
+    return out
+
+
+def multi_source_search(query: str, max_results: int = 10) -> List[Dict[str, str]]:
+    """
+    Single entry point for callers that previously looped arxiv_search,
+    ssrn_search and ideas_search back-to-back.
+    """
+    return _run(multi_source_search_async(query, max_results=max_results))
+
+
+# ---- Sync API (unchanged signatures; thin shims over the async core) ----
+def search(query: str, max_results: int = 10, site: str = "arxiv.org") -> List[Dict[str, str]]:
+    """
+    Existing tool impl: keeps arXiv fast-path, otherwise uses Brave.
+    """
+    return _run(search_async(query, max_results=max_results, site=site))
+
+
+# ---- Clean arXiv-only tool wrapper ----
+async def arxiv_search_async(query: str, max_results: int = 10) -> List[Dict[str, str]]:
+    return await _arxiv_api_search_async(query, max_results=max_results)
 
 
-# ---- New clean arXiv-only tool wrapper ----
 def arxiv_search(query: str, max_results: int = 10) -> List[Dict[str, str]]:
     """
     Exposed as its own MCP tool for clarity:
     - Always uses the arXiv API directly
     - No Brave dependency
     """
-    return _arxiv_api_search(query, max_results=max_results)
+    return _run(arxiv_search_async(query, max_results=max_results))
 
 
-# ---- NEW: Domain-allowlisted helpers for SSRN & IDEAS ----
-def _domain_search(query: str, domains: List[str], max_results: int = 10) -> List[Dict[str, str]]:
+# ---- Domain-allowlisted helpers for SSRN & IDEAS ----
+async def _domain_search_async(query: str, domains: List[str], max_results: int = 10) -> List[Dict[str, str]]:
     """
     Brave-backed domain-allowlisted search. Returns [{title, url, snippet}].
     Gracefully returns [] if no BRAVE_API_KEY is present.
     """
     if not domains:
         return []
-    site_clause = " OR ".join(f"site:{d}" for d in domains)
-    q = f"{query} ({site_clause})"
-    return _brave_search(q, max_results=max_results)
+    # One Brave call per domain, in parallel: mixed `site:a OR site:b`
+    # queries tend to return few results, and per-domain legs improve recall
+    # without adding wall time.
+    legs = await asyncio.gather(
+        *(_brave_search_async(f"{query} site:{d}", max_results=max_results) for d in domains)
+    )
+    seen: set = set()
+    merged: List[Dict[str, str]] = []
+    for leg in legs:
+        for r in leg:
+            if r["url"] not in seen:
+                seen.add(r["url"])
+                merged.append(r)
+    return merged[:max_results]
+
+
+async def ssrn_search_async(query: str, max_results: int = 10) -> List[Dict[str, str]]:
+    return await _domain_search_async(query, ["ssrn.com", "papers.ssrn.com"], max_results=max_results)
 
 
 def ssrn_search(query: str, max_results: int = 10) -> List[Dict[str, str]]:
@@ -107,7 +291,11 @@ def ssrn_search(query: str, max_results: int = 10) -> List[Dict[str, str]]:
     SSRN allowlisted search via Brave. Same shape as arxiv_search().
     Typical hosts: ssrn.com, papers.ssrn.com
     """
-    return _domain_search(query, ["ssrn.com", "papers.ssrn.com"], max_results=max_results)
+    return _run(ssrn_search_async(query, max_results=max_results))
+
+
+async def ideas_search_async(query: str, max_results: int = 10) -> List[Dict[str, str]]:
+    return await _domain_search_async(query, ["ideas.repec.org"], max_results=max_results)
 
 
 def ideas_search(query: str, max_results: int = 10) -> List[Dict[str, str]]:
@@ -115,4 +303,4 @@ def ideas_search(query: str, max_results: int = 10) -> List[Dict[str, str]]:
     IDEAS/RePEc allowlisted search via Brave. Same shape as arxiv_search().
     Canonical host: ideas.repec.org
     """
-    return _domain_search(query, ["ideas.repec.org"], max_results=max_results)
+    return _run(ideas_search_async(query, max_results=max_results))
@@ -1,6 +1,7 @@
 # packages/mcp_strategy_research/mcp_strategy_research/extractor.py
 from typing import Any, Dict, List, Optional, Tuple
-import json, os, re, hashlib
+import functools, json, os, re, hashlib, tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 from langchain_ollama import OllamaLLM
 
@@ -19,11 +20,17 @@ CHUNK_SIZE = int(os.getenv("RESEARCH_CHUNK_SIZE_CHARS", "6000"))
 CHUNK_OVERLAP = int(os.getenv("RESEARCH_CHUNK_OVERLAP_CHARS", "600"))
 MAX_CHUNKS = int(os.getenv("RESEARCH_MAX_CHUNKS", "6"))
 MAX_RETURN = int(os.getenv("RESEARCH_MAX_CANDIDATES", "8"))
+# Cap concurrent Ollama calls; the HTTP backend releases the GIL during I/O.
+LLM_CONCURRENCY = max(1, int(os.getenv("RESEARCH_LLM_CONCURRENCY", str(min(MAX_CHUNKS, os.cpu_count() or 4)))))
 
 
 # ---------------- LLM helpers ----------------
+@functools.lru_cache(maxsize=4)
 def _make_llm(model: str) -> OllamaLLM:
-    # Using OllamaLLM (ChatOllama is deprecated)
+    # Using OllamaLLM (ChatOllama is deprecated).
+    # Cached per model: params below are constants, so rebuilding the client
+    # per chunk/retry only cost construction time. Include any knob that
+    # becomes dynamic in the cache key.
     return OllamaLLM(
         model=model,
         temperature=0.15,
@@ -32,18 +39,30 @@ def _make_llm(model: str) -> OllamaLLM:
         repeat_penalty=1.05,
     )
 
+# Compiled once: runs per candidate on the hot path.
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
+
+_JSON_DECODER = json.JSONDecoder()
+
+
 def _json_from_text(s: str) -> List[Dict[str, Any]]:
     """
     Try to extract the first JSON array from a raw LLM response string.
+
+    Scans for '[' and attempts raw_decode at each position: linear work with
+    the C JSON parser, no regex backtracking, and it stops where the array
+    actually ends instead of grabbing everything up to the last ']'.
     """
-    m = re.search(r"\[[\s\S]*\]", s)
-    js = s if m is None else m.group(0)
-    try:
-        data = json.loads(js)
+    idx = s.find("[")
+    while idx != -1:
+        try:
+            data, _end = _JSON_DECODER.raw_decode(s, idx)
+        except json.JSONDecodeError:
+            idx = s.find("[", idx + 1)
+            continue
         if isinstance(data, list):
             return data
-    except Exception:
-        pass
+        idx = s.find("[", idx + 1)
     return []
 
 def _parse_hint(llm_hint: Optional[str]) -> Dict[str, Any]:
@@ -70,33 +89,89 @@ def _compose_prompt(text: str, indicators: List[str], llm_hint: Optional[str]) -
     return f"{instructions}\n\nTEXT:\n{text}\n\nReturn ONLY the JSON array."
 
 
+# ---------------- Disk cache for LLM extractions ----------------
+# Paper texts rarely change, so identical (model, prompt) pairs recur across
+# sessions; a hit costs one hash + one small file read vs a multi-second LLM
+# call. Keyed by sha1 of model + full prompt (which embeds the chunk text and
+# the instruction version). Best-effort: any cache I/O error just falls
+# through to the LLM.
+_LLM_CACHE_DIR = os.getenv(
+    "RESEARCH_LLM_CACHE_DIR", os.path.join(tempfile.gettempdir(), "mcp_llm_cache")
+)
+
+
+def _llm_cache_key(model: str, final_prompt: str) -> str:
+    return hashlib.sha1(f"{model}|{final_prompt}".encode("utf-8")).hexdigest()
+
+
+def _llm_cache_get(key: str) -> Optional[List[Dict[str, Any]]]:
+    try:
+        with open(os.path.join(_LLM_CACHE_DIR, f"{key}.json"), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, list) else None
+    except Exception:
+        return None
+
+
+def _llm_cache_put(key: str, value: List[Dict[str, Any]]) -> None:
+    try:
+        os.makedirs(_LLM_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(_LLM_CACHE_DIR, f"{key}.json"), "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False)
+    except Exception:
+        pass
+
+
 # ---------------- Chunking + dedup ----------------
 def _chunk_text(text: str, chunk_size: int, overlap: int, max_chunks: int) -> List[str]:
     if not text or len(text) <= chunk_size:
         return [text]
-    step = max(1, chunk_size - max(0, overlap))
+    overlap = max(0, overlap)
+    step_floor = max(1, chunk_size - overlap)
     chunks: List[str] = []
+    n = len(text)
     i = 0
-    while i < len(text) and len(chunks) < max_chunks:
-        chunks.append(text[i:i + chunk_size])
-        i += step
+    while i < n and len(chunks) < max_chunks:
+        end = min(i + chunk_size, n)
+        if end < n:
+            # Snap the cut to the nearest paragraph/sentence boundary around
+            # the target end so chunks don't split mid-sentence (fragments
+            # waste LLM tokens and degrade extraction). Look backward within
+            # the overlap window first, then forward up to a 1.2x hard cap.
+            lo = max(i + step_floor, i + 1)
+            hard_cap = min(n, i + int(chunk_size * 1.2))
+            snap = text.rfind("\n\n", lo, end)
+            if snap == -1:
+                snap = text.rfind(". ", lo, end)
+            if snap == -1:
+                snap = text.find("\n\n", end, hard_cap)
+            if snap == -1:
+                snap = text.find(". ", end, hard_cap)
+            if snap != -1 and snap + 2 > i:
+                end = snap + 2
+        chunks.append(text[i:end])
+        if end >= n:
+            break
+        i = max(end - overlap, i + 1)
     return chunks
 
 def _norm_str(s: str) -> str:
     s = (s or "").lower()
-    return re.sub(r"[^a-z0-9\s]", " ", s).strip()
+    return _NON_ALNUM_RE.sub(" ", s).strip()
 
-def _sig_for_candidate(c: Dict[str, Any]) -> str:
+def _sig_for_candidate(c: Dict[str, Any]) -> Tuple:
     """
     Build a stable signature to deduplicate similar candidates across chunks.
-    Combines name, timeframe, indicator list, and rules (normalized).
+    Combines name, timeframe, indicator list, and rules (normalized) into a
+    plain tuple: set membership only needs a hashable key, and tuple hashing
+    is C-implemented — no SHA1 block or UTF-8 encode per candidate.
     """
-    name = _norm_str(c.get("name", ""))
-    timeframe = _norm_str(c.get("timeframe", ""))
-    inds = ",".join(sorted(_norm_str(i.get("name", "")) for i in (c.get("indicators") or [])))
-    rules = " ".join((_norm_str(" ".join(c.get("entry_rules", []) + c.get("exit_rules", [])))))
-    blob = f"{name}|{timeframe}|{inds}|{rules}"
-    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+    return (
+        _norm_str(c.get("name", "")),
+        _norm_str(c.get("timeframe", "")),
+        tuple(sorted(_norm_str(i.get("name", "")) for i in (c.get("indicators") or []))),
+        tuple(sorted(_norm_str(r) for r in (c.get("entry_rules", []) + c.get("exit_rules", [])))),
+    )
 
 def _dedup_candidates(cands: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
     seen = set()
@@ -124,14 +199,24 @@ def extract_strategies(text: str, indicators: List[str], llm_hint: Optional[str]
     chunks = _chunk_text(text or "", CHUNK_SIZE, CHUNK_OVERLAP, MAX_CHUNKS)
     all_candidates: List[Dict[str, Any]] = []
 
+    def _invoke(model: str, final_prompt: str) -> List[Dict[str, Any]]:
+        key = _llm_cache_key(model, final_prompt)
+        cached = _llm_cache_get(key)
+        if cached is not None:
+            return cached
+        llm = _make_llm(model)
+        res = llm.invoke(final_prompt)
+        out = _json_from_text(res if isinstance(res, str) else getattr(res, "content", ""))
+        if out:
+            _llm_cache_put(key, out)
+        return out
+
     def _run_llm_once(chunk_text: str) -> List[Dict[str, Any]]:
         final_prompt = _compose_prompt(chunk_text, indicators, llm_hint)
 
         # Primary model
         try:
-            llm = _make_llm(_ollama_model())
-            res = llm.invoke(final_prompt)
-            out = _json_from_text(res if isinstance(res, str) else getattr(res, "content", ""))
+            out = _invoke(_ollama_model(), final_prompt)
             if out:
                 return out
         except Exception:
@@ -139,9 +224,7 @@ def extract_strategies(text: str, indicators: List[str], llm_hint: Optional[str]
 
         # Fallback model
         try:
-            llm = _make_llm(_ollama_fallback())
-            res = llm.invoke(final_prompt)
-            out = _json_from_text(res if isinstance(res, str) else getattr(res, "content", ""))
+            out = _invoke(_ollama_fallback(), final_prompt)
             if out:
                 return out
         except Exception:
@@ -149,12 +232,16 @@ def extract_strategies(text: str, indicators: List[str], llm_hint: Optional[str]
 
         return []
 
-    # Try chunked extraction first
+    # Try chunked extraction first (chunks dispatched concurrently; each LLM
+    # call is multi-second I/O, so wall time drops to roughly the slowest chunk)
     try:
-        for ck in chunks:
-            out = _run_llm_once(ck)
-            if out:
-                all_candidates.extend(out)
+        if len(chunks) == 1:
+            all_candidates.extend(_run_llm_once(chunks[0]))
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), LLM_CONCURRENCY)) as ex:
+                for out in ex.map(_run_llm_once, chunks):
+                    if out:
+                        all_candidates.extend(out)
         if all_candidates:
             return _dedup_candidates(all_candidates, MAX_RETURN)
     except Exception:
@@ -1,14 +1,41 @@
 # packages/mcp_strategy_research/mcp_strategy_research/fetcher.py
-from typing import Any, Dict
-import time, urllib.parse, urllib.robotparser, requests, fitz
-from bs4 import BeautifulSoup
+from typing import Any, Dict, List
+import io, re, tempfile, time, urllib.parse, urllib.robotparser, requests, fitz
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 
+from .storage import write_raw_text
+
+_WS_NL_RE = re.compile(r"\s*\n\s*")
+
 UA = os.getenv("RESEARCH_USER_AGENT", "StrategyResearchMCP/0.1 (+contact)")
 _MIN_INTERVAL = 0.6  # ~1–2 req/s global
+# PDFs stream page-by-page to storage; only this much text is returned inline.
+_PDF_PREVIEW_CHARS = int(os.getenv("RESEARCH_PDF_PREVIEW_CHARS", "8192"))
+# PDF bodies above this size spill to a temp file and are opened by path, so
+# PyMuPDF can mmap them instead of holding the whole document on the heap.
+_PDF_SPOOL_BYTES = int(float(os.getenv("RESEARCH_PDF_SPOOL_MB", "50")) * 1024 * 1024)
+
+# Shared session: keep-alive reuses TCP/TLS across fetches in a long-lived
+# MCP process instead of paying a fresh handshake per request.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": UA})
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
 
 _last_ts = 0.0
-_rp_cache: dict[str, urllib.robotparser.RobotFileParser] = {}
+# {base url: (fetched_at, parser)} — entries refresh after _ROBOTS_TTL so a
+# long-lived MCP process doesn't serve stale robots decisions forever.
+_ROBOTS_TTL = float(os.getenv("RESEARCH_ROBOTS_TTL", "86400"))
+_rp_cache: dict[str, tuple[float, urllib.robotparser.RobotFileParser]] = {}
 
 def _throttle():
     global _last_ts
@@ -18,40 +45,126 @@ def _throttle():
         time.sleep(_MIN_INTERVAL - elapsed)
     _last_ts = time.monotonic()
 
+def _load_robots(base: str) -> urllib.robotparser.RobotFileParser:
+    robots_url = urllib.parse.urljoin(base, "/robots.txt")
+    rp = urllib.robotparser.RobotFileParser()
+    try:
+        rp.set_url(robots_url)
+        rp.read()
+    except Exception:
+        rp = urllib.robotparser.RobotFileParser()
+        rp.parse("")  # treat as unknown → allow
+    return rp
+
+
+def _robots_for(base: str) -> urllib.robotparser.RobotFileParser:
+    hit = _rp_cache.get(base)
+    if hit is not None and time.monotonic() - hit[0] <= _ROBOTS_TTL:
+        return hit[1]
+    rp = _load_robots(base)
+    _rp_cache[base] = (time.monotonic(), rp)
+    return rp
+
+
 def _robots_ok(url: str) -> bool:
     u = urllib.parse.urlparse(url)
-    base = f"{u.scheme}://{u.netloc}"
-    rp = _rp_cache.get(base)
-    if rp is None:
-        robots_url = urllib.parse.urljoin(base, "/robots.txt")
-        rp = urllib.robotparser.RobotFileParser()
-        try:
-            rp.set_url(robots_url)
-            rp.read()
-        except Exception:
-            rp = urllib.robotparser.RobotFileParser()
-            rp.parse("")  # treat as unknown → allow
-        _rp_cache[base] = rp
+    rp = _robots_for(f"{u.scheme}://{u.netloc}")
     return rp.can_fetch(UA, url) if hasattr(rp, "can_fetch") else True
 
+
+def prefetch_robots(urls: List[str]) -> None:
+    """
+    Warm the robots cache for every host in `urls` concurrently, so batched
+    fetches don't each pay a serial robots.txt round-trip first.
+    """
+    now = time.monotonic()
+    bases = {f"{u.scheme}://{u.netloc}" for u in map(urllib.parse.urlparse, urls)}
+    stale = [b for b in bases
+             if b not in _rp_cache or now - _rp_cache[b][0] > _ROBOTS_TTL]
+    if not stale:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(stale))) as ex:
+        for base, rp in zip(stale, ex.map(_load_robots, stale)):
+            _rp_cache[base] = (time.monotonic(), rp)
+
 def fetch_url(url: str, render_js: bool = False) -> Dict[str, Any]:
     if not _robots_ok(url):
         raise PermissionError(f"robots.txt disallows: {url}")
-    headers = {"User-Agent": UA}
     _throttle()
-    r = requests.get(url, headers=headers, timeout=30)
-    r.raise_for_status()
-    ctype = r.headers.get("Content-Type","").lower()
-    text = ""
-    meta: Dict[str, Any] = {"status": r.status_code, "content_type": ctype}
-    if "pdf" in ctype or url.lower().endswith(".pdf"):
-        with fitz.open(stream=r.content, filetype="pdf") as doc:
-            text = "\n\n".join(page.get_text("text") for page in doc)
-    else:
-        soup = BeautifulSoup(r.text, "lxml")
-        for tag in soup(["script","style","noscript"]):
-            tag.decompose()
-        text = soup.get_text("\n", strip=True)
-    from .storage import write_raw_text
+    # stream=True: parsing overlaps the download instead of waiting for the
+    # whole body to buffer before the first byte is looked at.
+    with _SESSION.get(url, timeout=30, stream=True) as r:
+        r.raise_for_status()
+        ctype = r.headers.get("Content-Type","").lower()
+        meta: Dict[str, Any] = {"status": r.status_code, "content_type": ctype}
+        if "pdf" in ctype or url.lower().endswith(".pdf"):
+            # Stream pages straight into storage instead of joining the whole
+            # document in memory (100+ page papers can be tens of MB of text).
+            # Only a head preview is returned inline; the full text lives
+            # behind resource_uri.
+            # Spooled buffer: small PDFs stay in memory and are handed to
+            # PyMuPDF as a zero-copy memoryview; large ones roll over to disk
+            # and are opened by path (mmap) instead of living on the heap.
+            spool = tempfile.NamedTemporaryFile(suffix=".pdf")
+            buf = io.BytesIO()
+            size = 0
+            for chunk in r.iter_content(chunk_size=64 * 1024):
+                size += len(chunk)
+                if buf is not None and size > _PDF_SPOOL_BYTES:
+                    spool.write(buf.getbuffer())
+                    buf = None
+                (buf if buf is not None else spool).write(chunk)
+            preview: list = []
+            preview_len = 0
+
+            def _open_pdf():
+                if buf is not None:
+                    return fitz.open(stream=buf.getbuffer(), filetype="pdf")
+                spool.flush()
+                return fitz.open(spool.name)
+
+            def _pages():
+                nonlocal preview_len
+                with _open_pdf() as doc:
+                    for i, page in enumerate(doc):
+                        piece = ("\n\n" if i else "") + page.get_text("text")
+                        if preview_len < _PDF_PREVIEW_CHARS:
+                            preview.append(piece[:_PDF_PREVIEW_CHARS - preview_len])
+                            preview_len += len(preview[-1])
+                        yield piece
+
+            try:
+                uri = write_raw_text(_pages())
+            finally:
+                spool.close()
+            text = "".join(preview)
+            return {"url": url, "content_type": ctype, "text": text,
+                    "text_preview": text, "meta": meta, "resource_uri": uri}
+
+        # HTML path: hand the raw stream to lxml's C parser as it arrives;
+        # strip + text extraction are single C-level traversals instead of
+        # several Python-level BeautifulSoup passes.
+        r.raw.decode_content = True
+        tree = html.parse(r.raw).getroot()
+    if tree is None:
+        # Empty/whitespace-only body: lxml yields no root element.
+        return {"url": url, "content_type": ctype, "text": "", "meta": meta, "resource_uri": write_raw_text("")}
+    etree.strip_elements(tree, "script", "style", "noscript", with_tail=False)
+    text = _WS_NL_RE.sub("\n", tree.text_content()).strip()
     uri = write_raw_text(text)
     return {"url": url, "content_type": ctype, "text": text, "meta": meta, "resource_uri": uri}
+
+def fetch_urls(urls: List[str], render_js: bool = False) -> List[Dict[str, Any]]:
+    """
+    Batch fetch: robots.txt for all hosts is prefetched concurrently, then
+    pages are fetched through the (globally throttled) fetch_url path.
+    Per-URL failures are reported inline instead of aborting the batch.
+    """
+    prefetch_robots(urls)
+    out: List[Dict[str, Any]] = []
+    for url in urls:
+        try:
+            out.append(fetch_url(url, render_js=render_js))
+        except Exception as e:
+            out.append({"url": url, "error": str(e)})
+    return out
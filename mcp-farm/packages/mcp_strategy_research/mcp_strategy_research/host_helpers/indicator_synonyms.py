@@ -14,7 +14,8 @@ The host/orchestrator should gather canonical indicators and any synonyms
 This keeps the Strategy Research MCP API stable while improving extraction quality.
 """
 from __future__ import annotations
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+import functools
 import json
 
 
@@ -32,12 +33,24 @@ def build_llm_hint_from_registry(
     Returns:
       JSON string like: {"synonyms": {"RSI":["Relative Strength Index"], ...}}
     """
-    synonyms: Dict[str, List[str]] = {}
+    # The registry is effectively static per host session, so the same hint is
+    # rebuilt on every MCP call. Normalize to hashable tuples and memoize.
     registry_synonyms = registry_synonyms or {}
+    canon_tuple = tuple(sorted({c for c in (canonical or []) if isinstance(c, str) and c.strip()}))
+    syn_tuple = tuple(sorted((k, tuple(v or [])) for k, v in registry_synonyms.items()))
+    return _build_cached(canon_tuple, syn_tuple)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_cached(
+    canon_tuple: Tuple[str, ...],
+    syn_tuple: Tuple[Tuple[str, Tuple[str, ...]], ...],
+) -> str:
+    synonyms: Dict[str, List[str]] = {}
+    registry_synonyms = dict(syn_tuple)
 
-    canon_set = {c for c in (canonical or []) if isinstance(c, str) and c.strip()}
-    for name in sorted(canon_set):
-        vals = registry_synonyms.get(name) or []
+    for name in canon_tuple:
+        vals = registry_synonyms.get(name) or ()
         # Deduplicate (case-insensitive) and drop self-name echoes
         seen = set()
         clean = []
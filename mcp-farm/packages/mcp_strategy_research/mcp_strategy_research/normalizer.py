@@ -1,7 +1,24 @@
 # packages/mcp_strategy_research/mcp_strategy_research/normalizer.py
 from typing import Any, Dict, List, Optional
+import functools
 import json
-from jsonschema import validate, Draft202012Validator
+import string
+import sys
+from types import MappingProxyType
+
+import orjson
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import ValidationError
+
+try:
+    import jsonschema_rs  # Rust validation tree: fastest option when present
+except ImportError:  # pragma: no cover
+    jsonschema_rs = None
+
+try:
+    import fastjsonschema  # compiled validator: ~100x faster on valid payloads
+except ImportError:  # pragma: no cover
+    fastjsonschema = None
 from importlib.resources import files, as_file
 
 from .storage import write_normalized
@@ -54,20 +71,67 @@ _DEFAULT_SCHEMA: Dict[str, Any] = {
   "additionalProperties": True
 }
 
+@functools.lru_cache(maxsize=1)
 def _load_schema() -> Dict[str, Any]:
+    # Idempotent and cached: re-imports of vendored copies share one parse.
+    # Bytes mode skips the text-layer decode.
     try:
         with as_file(files("mcp_strategy_research.schemas") / "strategy_v1.json") as p:
-            with open(p, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(p, "rb") as f:
+                return orjson.loads(f.read())
     except Exception:
         return _DEFAULT_SCHEMA
 
 SCHEMA: Dict[str, Any] = _load_schema()
-Draft202012Validator.check_schema(SCHEMA)
+if not globals().get("_SCHEMA_CHECKED", False):
+    Draft202012Validator.check_schema(SCHEMA)
+    _SCHEMA_CHECKED = True
+# Built once: jsonschema.validate() would re-instantiate a validator and
+# re-run check_schema on every call.
+_VALIDATOR = Draft202012Validator(SCHEMA)
+
+# Validator preference order, all compiled once at import: jsonschema-rs
+# (Rust) > fastjsonschema (generated Python) > cached jsonschema validator.
+_RS_VALIDATOR = None
+if jsonschema_rs is not None:
+    try:
+        _RS_VALIDATOR = jsonschema_rs.validator_for(SCHEMA)
+    except Exception:
+        _RS_VALIDATOR = None
+
+_FJS_VALIDATE = None
+if fastjsonschema is not None:
+    try:
+        _FJS_VALIDATE = fastjsonschema.compile(SCHEMA)
+    except Exception:
+        _FJS_VALIDATE = None
+
+
+def _validate(obj: Dict[str, Any]) -> None:
+    """Validate against SCHEMA, raising jsonschema's ValidationError."""
+    if _RS_VALIDATOR is not None:
+        try:
+            _RS_VALIDATOR.validate(obj)
+            return
+        except jsonschema_rs.ValidationError as e:
+            raise ValidationError(str(e)) from e
+    if _FJS_VALIDATE is not None:
+        try:
+            _FJS_VALIDATE(obj)
+            return
+        except fastjsonschema.JsonSchemaException as e:
+            raise ValidationError(str(e)) from e
+    # Boolean check first: the happy path skips the error-collection
+    # machinery; full validate() only runs to produce the error detail.
+    if not _VALIDATOR.is_valid(obj):
+        _VALIDATOR.validate(obj)
 
 # ----------- Light canonicalization / validation helpers -----------
 
-_ALIAS_MAP = {
+# Read-only view: the alias table is fixed at import and shared. Values are
+# interned so every normalized strategy references the same "RSI"/"MACD"
+# objects instead of accumulating equal copies.
+_ALIAS_MAP = MappingProxyType({k: sys.intern(v) for k, v in {
     "relative strength index": "RSI",
     "rsi": "RSI",
     "moving average convergence divergence": "MACD",
@@ -88,79 +152,130 @@ _ALIAS_MAP = {
     "mfi": "MFI",
     "commodity channel index": "CCI",
     "cci": "CCI",
-}
+}.items()})
 
-def _canon_indicator(name: str, allowed: Optional[set] = None) -> str:
-    if not name:
+_SCHEMA_VERSION = sys.intern("strategy.v1")
+
+# Canonical names the LLM often emits verbatim; checking membership first
+# skips the strip/lower allocations on that fast path.
+_CANON_SET = frozenset(_ALIAS_MAP.values())
+
+# Indicator names are ASCII; one translate pass replaces the extra string
+# allocation a chained .lower() would add.
+_LOWER_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+@functools.lru_cache(maxsize=4096)
+def _canon_cached(name: str, allowed_fs: frozenset) -> str:
+    if name in _CANON_SET:
+        # candidate would equal name, so the allowed-filter can't change it
         return name
-    candidate = _ALIAS_MAP.get(name.strip().lower(), name)
-    if allowed and candidate not in allowed:
+    stripped = name.strip()
+    candidate = _ALIAS_MAP.get(stripped.translate(_LOWER_TABLE), name)
+    if allowed_fs and candidate not in allowed_fs:
         return name
     return candidate
 
+def _canon_indicator(name: str, allowed: Optional[set] = None) -> str:
+    # LLM outputs repeat the same handful of names; memoize the pure
+    # normalization so repeats skip the strip/lower/lookup work.
+    if not name:
+        return name
+    return _canon_cached(name, frozenset(allowed or ()))
+
 def _canon_all_indicators(ind_list: List[Dict[str, Any]], allowed_names: List[str]) -> List[Dict[str, Any]]:
-    allowed = set(allowed_names or [])
+    allowed_fs = frozenset(allowed_names or [])
+    canon = _canon_cached
     out: List[Dict[str, Any]] = []
     for itm in ind_list or []:
-        nm = _canon_indicator(str(itm.get("name","")), allowed)
+        name = str(itm.get("name",""))
+        nm = canon(name, allowed_fs) if name else name
         params = itm.get("params", {}) or {}
         out.append({"name": nm, "params": params})
     return out
 
 # ----------- Rule coercion (objects → readable strings) -----------
 
+def _dumps(o: Any) -> str:
+    # orjson output is already compact, so no separators tuning needed.
+    # stdlib json covers the few types orjson rejects (e.g. tuples).
+    try:
+        return orjson.dumps(o).decode()
+    except TypeError:
+        return json.dumps(o, ensure_ascii=False, separators=(",", ":"))
+
+def _stringify_dict(rule: Dict[str, Any]) -> str:
+    if len(rule) == 1:
+        k = next(iter(rule))
+        v = rule[k]
+        if str(k).strip().upper() == "ATR" and isinstance(v, dict):
+            if v.get("trailing_stop") is True:
+                mult = v.get("multiple", v.get("multiplier", v.get("atr_mult")))
+                if mult is not None:
+                    try:
+                        mult_val = float(mult)
+                    except Exception:
+                        mult_val = mult
+                    return f"trailing_stop(ATR, multiple={mult_val})"
+                return "trailing_stop(ATR)"
+    return _dumps(rule)
+
+# One hash+lookup on the exact type instead of an isinstance chain per rule.
+_RULE_DISPATCH = {
+    str: lambda r: r.strip(),
+    dict: _stringify_dict,
+    list: _dumps,
+    tuple: _dumps,
+    int: str,
+    float: str,
+    bool: str,
+    type(None): lambda _: "",
+}
+
 def _stringify_rule(rule: Any) -> str:
-    if rule is None:
-        return ""
-    if isinstance(rule, str):
-        return rule.strip()
+    fn = _RULE_DISPATCH.get(type(rule))
     try:
-        if isinstance(rule, dict):
-            if len(rule) == 1:
-                k = next(iter(rule))
-                v = rule[k]
-                if str(k).strip().upper() == "ATR" and isinstance(v, dict):
-                    if v.get("trailing_stop") is True:
-                        mult = v.get("multiple", v.get("multiplier", v.get("atr_mult")))
-                        if mult is not None:
-                            try:
-                                mult_val = float(mult)
-                            except Exception:
-                                mult_val = mult
-                            return f"trailing_stop(ATR, multiple={mult_val})"
-                        return "trailing_stop(ATR)"
-            return json.dumps(rule, ensure_ascii=False, separators=(",", ":"))
-        if isinstance(rule, (list, tuple)):
-            return json.dumps(rule, ensure_ascii=False, separators=(",", ":"))
-        if isinstance(rule, (int, float, bool)):
-            return str(rule)
+        if fn is not None:
+            return fn(rule)
         return str(rule)
     except Exception:
         try:
-            return json.dumps(rule, ensure_ascii=False, separators=(",", ":"))
+            return _dumps(rule)
         except Exception:
             return str(rule)
 
 def _coerce_rules(rules: Any) -> List[str]:
     if not rules:
         return []
-    out: List[str] = []
-    for r in rules:
-        s = _stringify_rule(r)
-        if s:
-            out.append(s)
-    return out
+    # Comprehension with a local binding: drops the per-iteration global
+    # lookup and list.append attribute fetch.
+    sr = _stringify_rule
+    return [s for s in (sr(r) for r in rules) if s]
 
 # ----------- Sources coercion (strings/objects → objects) -----------
 
-_PLACEHOLDERS = {"URL_TO_BE_ATTACHED", "TBD", "N/A", "NA", "NONE", ""}
+_PLACEHOLDERS = frozenset({"URL_TO_BE_ATTACHED", "TBD", "N/A", "NA", "NONE", ""})
 
 def _coerce_sources(raw: Any, source_url: str) -> List[Dict[str, Any]]:
+    # Fast path: the LLM often already emits a conforming list of
+    # {"url": ...} dicts; return it as-is instead of rebuilding each entry.
+    if (
+        isinstance(raw, list)
+        and raw
+        and all(
+            isinstance(it, dict)
+            and isinstance(it.get("url"), str)
+            and it["url"].strip()
+            and it["url"].strip().upper() not in _PLACEHOLDERS
+            for it in raw
+        )
+    ):
+        return raw
+
     out: List[Dict[str, Any]] = []
 
     def _add(url_val: Optional[str], doi_val: Optional[str] = None):
         uv = (url_val or "").strip()
-        if not uv or uv.strip().upper() in _PLACEHOLDERS:
+        if not uv or uv.upper() in _PLACEHOLDERS:
             return
         out.append({"url": uv, "doi": doi_val})
 
@@ -218,6 +333,16 @@ def _coerce_backtest_hints(raw: Any) -> Optional[Dict[str, Any]]:
 
 # -------------------------------------------------------------------
 
+# Default templates built once at import; _fill_defaults takes a shallow
+# copy only when the caller omitted the field. Nested values are shared and
+# treated as read-only (the normalized object is only serialized downstream).
+# Plain dicts, not MappingProxyType: the result must stay JSON-serializable.
+_PSIZE_DEFAULT = {"type": "fixed_risk", "risk_pct": 1.0}
+_DEFAULTS_DEFAULT = {"stop": {"atr_mult": 2.0}, "take_profit": None}
+_HINTS_DEFAULT = {"warmup_bars": 200, "min_data": None}
+_CONF_DEFAULT = {"evidence": ["text-derived"], "notes": "LLM-normalized"}
+_UNIVERSE_DEFAULT = ("BTCUSDT",)
+
 def _fill_defaults(c: Dict[str, Any], source_url: str, allowed_names: List[str]) -> Dict[str, Any]:
     """
     Fill required fields and reasonable defaults for missing bits, with indicator canonicalization,
@@ -225,22 +350,22 @@ def _fill_defaults(c: Dict[str, Any], source_url: str, allowed_names: List[str])
     """
     coerced_hints = _coerce_backtest_hints(c.get("backtest_hints"))
     if coerced_hints is None:
-        coerced_hints = {"warmup_bars": 200, "min_data": None}
+        coerced_hints = dict(_HINTS_DEFAULT)
 
     return {
-        "schema_version": "strategy.v1",
+        "schema_version": _SCHEMA_VERSION,
         "name": c.get("name") or "Unnamed Strategy",
         "description": c.get("description") or "",
-        "universe": c.get("universe") or ["BTCUSDT"],
+        "universe": c.get("universe") or list(_UNIVERSE_DEFAULT),
         "timeframe": c.get("timeframe") or "1h",
         "indicators": _canon_all_indicators(c.get("indicators") or [], allowed_names),
         "entry_rules": _coerce_rules(c.get("entry_rules") or []),
         "exit_rules": _coerce_rules(c.get("exit_rules") or []),
-        "position_sizing": c.get("position_sizing") or {"type": "fixed_risk", "risk_pct": 1.0},
-        "defaults": c.get("defaults") or {"stop": {"atr_mult": 2.0}, "take_profit": None},
+        "position_sizing": c.get("position_sizing") or dict(_PSIZE_DEFAULT),
+        "defaults": c.get("defaults") or dict(_DEFAULTS_DEFAULT),
         "backtest_hints": coerced_hints,
         "sources": _coerce_sources(c.get("sources"), source_url),
-        "confidence": c.get("confidence") or {"evidence": ["text-derived"], "notes": "LLM-normalized"},
+        "confidence": c.get("confidence") or dict(_CONF_DEFAULT),
     }
 
 def normalize_strategy(doc: Dict[str, Any], source_url: str, indicators: List[str]) -> Dict[str, Any]:
@@ -257,7 +382,17 @@ def normalize_strategy(doc: Dict[str, Any], source_url: str, indicators: List[st
     if not obj["exit_rules"]:
         obj["exit_rules"] = ["RSI crosses below 70"]
 
-    validate(instance=obj, schema=SCHEMA)
+    _validate(obj)
 
     uri = write_normalized(obj)
     return {"uri": uri, "json": obj}
+
+def normalize_strategies(docs: List[Dict[str, Any]], source_url: str, indicators: List[str]) -> List[Dict[str, Any]]:
+    """
+    Batch variant for callers looping over an LLM candidate array.
+    The allowed-indicator set is frozen once for the whole batch (frozenset
+    input passes through _canon_all_indicators untouched) and every doc
+    reuses the module-level compiled validator.
+    """
+    allowed_fs = frozenset(indicators or [])
+    return [normalize_strategy(doc, source_url, allowed_fs) for doc in docs or []]
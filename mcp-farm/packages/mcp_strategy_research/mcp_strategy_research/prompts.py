@@ -1,6 +1,15 @@
 # packages/mcp_strategy_research/mcp_strategy_research/prompts.py
+from functools import lru_cache
+from io import StringIO
 from typing import Dict, List, Optional
 
+_QUERY_PATTERNS = (
+    "{ind} strategy {topic}",
+    "{ind} crossover {topic}",
+    "{ind} backtest {topic}",
+    "{ind} trading rules {topic}",
+)
+
 
 def plan_queries(topic: str, indicators: List[str], max_per_indicator: int, source: str = "arxiv") -> List[str]:
     """
@@ -8,20 +17,13 @@ def plan_queries(topic: str, indicators: List[str], max_per_indicator: int, sour
     (Unchanged tool behavior/signature.)
     """
     site = "site:arxiv.org" if source.lower() == "arxiv" else ""
-    patterns = [
-        "{ind} strategy {topic}",
-        "{ind} crossover {topic}",
-        "{ind} backtest {topic}",
-        "{ind} trading rules {topic}",
+    # Slice once, not per indicator, and build in one comprehension.
+    pats = _QUERY_PATTERNS[:max_per_indicator]
+    return [
+        f"{q} {site}" if site else q
+        for ind in indicators
+        for q in (p.format(ind=ind, topic=topic) for p in pats)
     ]
-    out: List[str] = []
-    for ind in indicators:
-        for p in patterns[:max_per_indicator]:
-            q = p.format(ind=ind, topic=topic)
-            if site:
-                q = f"{q} {site}"
-            out.append(q)
-    return out
 
 
 def strategy_extraction_guidelines_placeholder() -> str:
@@ -35,28 +37,34 @@ def strategy_extraction_guidelines_placeholder() -> str:
     )
 
 
+# Hoisted so the sort key isn't a fresh closure per call.
+_SYN_SORT_KEY = lambda kv: kv[0].lower()
+
+
 def _format_synonyms_block(synonyms: Optional[Dict[str, List[str]]]) -> str:
     """
     Render a human-readable synonyms section for the system prompt.
     """
     if not synonyms:
         return "- (no extra synonyms provided)"
-    lines: List[str] = []
-    for name, syns in sorted(synonyms.items(), key=lambda kv: kv[0].lower()):
-        if syns:
-            # sort + dedupe, display nicely
-            seen = set()
-            clean = []
-            for s in syns:
-                s = (s or "").strip()
-                if s and s.lower() not in seen:
-                    seen.add(s.lower())
-                    clean.append(s)
-            if clean:
-                lines.append(f"- {name}: {', '.join(clean)}")
-                continue
-        lines.append(f"- {name}: (none)")
-    return "\n".join(lines)
+    # Single pass into a StringIO: dedupe (case-insensitive, first wins) via
+    # one dict instead of a seen-set plus parallel list, no lines list/join.
+    buf = StringIO()
+    first = True
+    for name, syns in sorted(synonyms.items(), key=_SYN_SORT_KEY):
+        uniq: Dict[str, str] = {}
+        for s in syns or ():
+            s = (s or "").strip()
+            if s:
+                uniq.setdefault(s.lower(), s)
+        if not first:
+            buf.write("\n")
+        first = False
+        if uniq:
+            buf.write(f"- {name}: {', '.join(uniq.values())}")
+        else:
+            buf.write(f"- {name}: (none)")
+    return buf.getvalue()
 
 
 def build_extraction_prompt(indicators: List[str], synonyms: Optional[Dict[str, List[str]]] = None) -> str:
@@ -64,7 +72,19 @@ def build_extraction_prompt(indicators: List[str], synonyms: Optional[Dict[str,
     Build the instruction text for the LLM extractor.
     This is returned as a single string; the extractor will append the source text.
     """
+    # The same (indicators, synonyms) pair recurs across every chunk of a
+    # research session; normalize to hashable tuples and memoize.
+    syn_key = (
+        tuple(sorted((k, tuple(v or [])) for k, v in synonyms.items()))
+        if synonyms else None
+    )
+    return _build_extraction_prompt_cached(tuple(indicators or ()), syn_key)
+
+
+@lru_cache(maxsize=32)
+def _build_extraction_prompt_cached(indicators: tuple, synonyms_key: Optional[tuple]) -> str:
     inds = ", ".join(indicators) if indicators else "RSI, MACD, SMA, EMA, ATR, BBANDS"
+    synonyms = {k: list(v) for k, v in synonyms_key} if synonyms_key else None
     syn_text = _format_synonyms_block(synonyms)
 
     return f"""
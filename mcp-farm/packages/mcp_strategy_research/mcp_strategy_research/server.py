@@ -54,6 +54,11 @@ def ssrn_search(query: str, max_results: int = 10) -> List[Dict[str, str]]:
 def ideas_search(query: str, max_results: int = 10) -> List[Dict[str, str]]:
     return brave_mod.ideas_search(query=query, max_results=max_results)
 
+# NEW: arXiv + SSRN + IDEAS fired concurrently, merged and URL-deduped
+@mcp.tool()
+async def multi_source_search(query: str, max_results: int = 10) -> List[Dict[str, str]]:
+    return await brave_mod.multi_source_search_async(query, max_results=max_results)
+
 @mcp.tool()
 def fetch_url(url: str, render_js: bool = False) -> Dict[str, Any]:
     return fetch_mod.fetch_url(url, render_js=render_js)
@@ -66,9 +71,14 @@ def extract_strategies(text: str, indicators: Optional[List[str]] = None, llm_hi
 def normalize_strategy(doc: Dict[str, Any], source_url: str, indicators: Optional[List[str]] = None) -> Dict[str, Any]:
     return norm_mod.normalize_strategy(doc, source_url, indicators or [])
 
+# NEW: batch normalization over a whole LLM candidate array
+@mcp.tool()
+def normalize_strategies(docs: List[Dict[str, Any]], source_url: str, indicators: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    return norm_mod.normalize_strategies(docs, source_url, indicators or [])
+
 @mcp.tool()
-def bundle_results(strategy_resource_uris: List[str]) -> Dict[str, Any]:
-    return store_mod.bundle_results(strategy_resource_uris)
+async def bundle_results(strategy_resource_uris: List[str]) -> Dict[str, Any]:
+    return await store_mod.bundle_results_async(strategy_resource_uris)
 
 # --------------------- RESOURCES ---------------------
 
@@ -11,6 +11,14 @@ def test_chunking_produces_multiple_chunks_for_long_text():
     assert any(chunks[i][-20:] == chunks[i+1][:20] for i in range(len(chunks)-1))
 
 
+def test_chunking_snaps_to_sentence_boundaries():
+    text = ("Alpha beta gamma delta epsilon zeta. " * 30).strip()
+    chunks = _chunk_text(text, chunk_size=100, overlap=30, max_chunks=10)
+    assert len(chunks) >= 2
+    # Every non-final chunk should end on a sentence boundary, not mid-word
+    assert all(c.rstrip().endswith(".") for c in chunks[:-1])
+
+
 def test_dedup_collapses_duplicate_candidates_across_chunks():
     # Simulate the same candidate emitted from two different chunks
     base = {
@@ -0,0 +1,58 @@
+# packages/mcp_strategy_research/tests/test_search_cache.py
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from mcp_strategy_research import brave
+
+_ATOM = b"""<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">
+<entry><id>http://arxiv.org/abs/1234.5</id><title>T1</title>
+<summary>S1</summary><link href="http://arxiv.org/abs/1234.5"/></entry></feed>"""
+
+
+class _FakeResp:
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return _ATOM
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    closed = False
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, *args, **kwargs):
+        self.calls += 1
+        return _FakeResp()
+
+    async def close(self):
+        self.closed = True
+
+
+def test_arxiv_search_hits_ttl_cache_on_repeat_query():
+    brave.clear_search_cache()
+    session = _FakeSession()
+    with patch.object(brave, "_get_session", AsyncMock(return_value=session)):
+        async def run():
+            first = await brave._arxiv_api_search_async("rsi strategy")
+            second = await brave._arxiv_api_search_async("rsi strategy")
+            return first, second
+
+        first, second = asyncio.run(run())
+
+    assert first == second
+    assert first[0]["url"] == "http://arxiv.org/abs/1234.5"
+    assert session.calls == 1, "second call should be served from the TTL cache"
+
+    brave.clear_search_cache()
+    with patch.object(brave, "_get_session", AsyncMock(return_value=session)):
+        asyncio.run(brave._arxiv_api_search_async("rsi strategy"))
+    assert session.calls == 2, "clear_search_cache should force a refetch"